@@ -39,19 +39,72 @@ INT = 0b01010010
 IRET = 0b00010011
 ADDI = 0b10101110
 
+# conditional jumps - opcode: (flag mask, jump when no flag in mask is set,
+# comparison of the CMP operands it jumps on)
+JUMP_CONDITIONS = {
+    JEQ: (0b00000001, False, "=="),
+    JGE: (0b00000011, False, ">="),
+    JGT: (0b00000010, False, ">"),
+    JLE: (0b00000101, False, "<="),
+    JLT: (0b00000100, False, "<"),
+    JNE: (0b00000001, True, "!="),
+}
+
+# Python source translate() emits for commands it compiles inline,
+# where {a} and {b} are the command's operands and {n} the next address;
+# commands that write ram drop the translated blocks if they overwrite one
+TRANSLATIONS = {
+    NOP: "pass",
+    LDI: "reg[{a}] = {b}",
+    LD: "reg[{a}] = ram[reg[{b}]]",
+    ST: "ram[reg[{a}]] = reg[{b}]\nif translated[reg[{a}]]: cpu.invalidate(); return {n}",
+    PRN: "print(reg[{a}])",
+    PUSH: "reg[7] = (reg[7] - 1) & 0xFF; ram[reg[7]] = reg[{a}]\nif translated[reg[7]]: cpu.invalidate(); return {n}",
+    POP: "reg[{a}] = ram[reg[7]]; reg[7] = (reg[7] + 1) & 0xFF",
+    ADD: "reg[{a}] = (reg[{a}] + reg[{b}]) & 0xFF",
+    SUB: "reg[{a}] = (reg[{a}] - reg[{b}]) & 0xFF",
+    MUL: "reg[{a}] = (reg[{a}] * reg[{b}]) & 0xFF",
+    AND: "reg[{a}] = reg[{a}] & reg[{b}]",
+    OR: "reg[{a}] = reg[{a}] | reg[{b}]",
+    XOR: "reg[{a}] = reg[{a}] ^ reg[{b}]",
+    SHL: "reg[{a}] = (reg[{a}] << reg[{b}]) & 0xFF",
+    SHR: "reg[{a}] = reg[{a}] >> reg[{b}]",
+    INC: "reg[{a}] = (reg[{a}] + 1) & 0xFF",
+    DEC: "reg[{a}] = (reg[{a}] - 1) & 0xFF",
+    NOT: "reg[{a}] = ~reg[{a}] & 0xFF",
+    ADDI: "reg[{a}] = (reg[{a}] + {b}) & 0xFF",
+    CMP: "x = reg[{a}]; y = reg[{b}]; cpu.fl = 0b00000001 if x == y else 0b00000010 if x > y else 0b00000100",
+}
+
+
+def takes_operands(handler, num_operands):
+    """
+    Wrap a handler so it can be called as handler(cpu, operand_a, operand_b)
+    regardless of how many operands its command uses.
+    """
+    if num_operands == 0:
+        return lambda cpu, operand_a, operand_b: handler(cpu)
+    if num_operands == 1:
+        return lambda cpu, operand_a, operand_b: handler(cpu, operand_a)
+    return handler
+
+
+class GuestDivZero(Exception):
+    """Raised when a program divides (DIV or MOD) by zero."""
+
 
 class CPU:
     """Main CPU class."""
 
     def __init__(self):
         """Construct a new CPU."""
-        # memory
-        self.ram = [0] * 256
+        # memory - one byte per address
+        self.ram = bytearray(256)
         # registers
             # R5 = interrupt mask (IM)
             # R6 = interrupt status (IS)
             # R7 = stack pointer (SP)
-        self.reg = [0] * 8
+        self.reg = bytearray(8)
         # reset SP
         self.reg[7] = 0xF4
 
@@ -62,45 +115,66 @@ class CPU:
         self.fl = 0
 
         self.interrupts_enabled = 1
-
-        # branch table
-        self.branchtable = {
-            HLT: self.HLT,
-            LDI: self.LDI,
-            PRN: self.PRN,
-            ADD: self.alu,
-            SUB: self.alu,
-            MUL: self.alu,
-            DIV: self.alu,
-            AND: self.alu,
-            CMP: self.alu,
-            DEC: self.alu,
-            INC: self.alu,
-            MOD: self.alu,
-            NOT: self.alu,
-            OR: self.alu,
-            SHL: self.alu,
-            SHR: self.alu,
-            XOR: self.alu,
-            PUSH: self.PUSH,
-            POP: self.POP,
-            CALL: self.CALL,
-            RET: self.RET,
-            ST: self.ST,
-            JMP: self.JMP,
-            JEQ: self.JEQ,
-            JGE: self.JGE,
-            JGT: self.JGT,
-            JLE: self.JLE,
-            JLT: self.JLT,
-            JNE: self.JNE,
-            LD: self.LD,
-            NOP: self.NOP,
-            PRA: self.PRA,
-            INT: self.INT,
-            IRET: self.IRET,
-            ADDI: self.alu,
-        }
+        # set once a decoded instruction touches IM/IS or uses INT/IRET
+        self.uses_interrupts = False
+
+        # translated blocks, indexed by start address (None if not translated yet)
+        self.blocks = [None] * 256
+        # 1 for every address holding a command of a translated block
+        self.translated = bytearray(256)
+
+        # branch table, indexed by opcode (None for invalid opcodes and for
+        # jumps, which translate() always emits inline)
+        # handlers are plain functions, called with the cpu as first argument
+        self.branchtable = [None] * 256
+        self.branchtable[HLT] = CPU.HLT
+        self.branchtable[LDI] = CPU.LDI
+        self.branchtable[PRN] = CPU.PRN
+        self.branchtable[PUSH] = CPU.PUSH
+        self.branchtable[POP] = CPU.POP
+        self.branchtable[CALL] = CPU.CALL
+        self.branchtable[RET] = CPU.RET
+        self.branchtable[ST] = CPU.ST
+        self.branchtable[LD] = CPU.LD
+        self.branchtable[NOP] = CPU.NOP
+        self.branchtable[PRA] = CPU.PRA
+        self.branchtable[INT] = CPU.INT
+        self.branchtable[IRET] = CPU.IRET
+
+        # alu table, indexed by opcode (None for non-ALU opcodes)
+        self.alutable = [None] * 256
+        self.alutable[ADD] = CPU.ADD
+        self.alutable[SUB] = CPU.SUB
+        self.alutable[MUL] = CPU.MUL
+        self.alutable[DIV] = CPU.DIV
+        self.alutable[AND] = CPU.AND
+        self.alutable[CMP] = CPU.CMP
+        self.alutable[DEC] = CPU.DEC
+        self.alutable[INC] = CPU.INC
+        self.alutable[MOD] = CPU.MOD
+        self.alutable[NOT] = CPU.NOT
+        self.alutable[OR] = CPU.OR
+        self.alutable[SHL] = CPU.SHL
+        self.alutable[SHR] = CPU.SHR
+        self.alutable[XOR] = CPU.XOR
+        self.alutable[ADDI] = CPU.ADDI
+
+        # give every branch table entry the same call signature so it can be
+        # called as handler(cpu, operand_a, operand_b) without checking the
+        # opcode; alu handlers already take both operands and fill their
+        # slots straight from the alu table
+        for op in range(256):
+            if self.alutable[op] is not None:
+                self.branchtable[op] = self.alutable[op]
+            elif self.branchtable[op] is not None:
+                self.branchtable[op] = takes_operands(self.branchtable[op], op >> 6)
+
+        # pc advance table, indexed by opcode - how far to move the pc after
+        # the command runs, or 0 if the command sets pc
+        # op: AABCDDDD, where AA == num operands and C == sets pc
+        self.advancetable = bytes(
+            0 if op & 0b00010000 else (op >> 6) + 1 for op in range(256)
+        )
 
     def load(self):
         """Load a program into memory."""
@@ -110,157 +184,294 @@ class CPU:
             print("ERROR: must have file name")
             sys.exit(1)
 
-        address = 0
-
         try:
             with open(sys.argv[1]) as f:
-                # read all the lines
-                for line in f:
-                    # parse out comments
-                    comment_split = line.strip().split("#")
+                text = f.read()
+        except FileNotFoundError:
+            print("File not found")
+            sys.exit(2)
 
-                    value = comment_split[0].strip()
+        # parse out comments, ignore blank lines and cast the numbers from
+        # strings to ints
+        values = (line.split("#", 1)[0].strip() for line in text.splitlines())
+        program = [int(value, 2) for value in values if value]
 
-                    # ignore blank lines
-                    if value == "":
-                        continue
+        if len(program) > len(self.ram):
+            print("ERROR: program does not fit in memory")
+            sys.exit(1)
 
-                    # cast the numbers from strings to ints
-                    num = int(value, 2)
+        for value in program:
+            if not 0 <= value <= 0xFF:
+                print(f"ERROR: value does not fit in a byte: {bin(value)}")
+                sys.exit(1)
 
-                    self.ram[address] = num
-                    address += 1
+        self.ram[:len(program)] = bytes(program)
 
-        except FileNotFoundError:
-            print("File not found")
-            sys.exit(2)
+        # translate the entry block; jump targets live in registers, so the
+        # rest are translated when they are first reached
+        self.invalidate()
+        self.blocks[0] = self.translate(0)
+
+    def decode(self, pc):
+        """
+        Decode the instruction at the given address into a tuple of
+        (op, operand_a, operand_b, handler, advance), where advance is how far
+        to move the pc after the handler runs (0 if it sets the pc itself).
+        """
+        # read command and operands in one slice, wrapping past the end of ram
+        instruction = self.ram[pc:pc + 3]
+        if len(instruction) < 3:
+            instruction += self.ram[:3 - len(instruction)]
+        op, operand_a, operand_b = instruction
+
+        handler = self.branchtable[op]
+        advance = self.advancetable[op]
+
+        # note if the command can raise or observe an interrupt: INT/IRET,
+        # or a register operand naming IM or IS (LDI/ADDI's b is a value)
+        if op == INT or op == IRET:
+            self.uses_interrupts = True
+        elif op >> 6 >= 1 and (operand_a == 5 or operand_a == 6):
+            self.uses_interrupts = True
+        elif op >> 6 == 2 and op != LDI and op != ADDI and (operand_b == 5 or operand_b == 6):
+            self.uses_interrupts = True
+
+        return (op, operand_a, operand_b, handler, advance)
+
+    def translate(self, pc):
+        """
+        Translate the straight-line run of commands starting at the given
+        address into a compiled Python function that executes them and
+        returns the address to continue at. Returns None if the first command
+        is invalid.
+
+        A block ends at a jump, after any command run through its handler
+        (handlers may change anything, including interrupt state) and after
+        a write to the interrupt registers. The timer and pending interrupts
+        are only checked by run() between blocks, not before every command,
+        so they are serviced at block boundaries (a fused CMP and conditional
+        jump count as one step).
+        """
+        start = pc
+        end = pc
+        lines = []
+
+        while pc < 256:
+            op, operand_a, operand_b, handler, advance = self.decode(pc)
+
+            # CMP followed by a conditional jump branches on the comparison
+            # itself instead of re-reading the flags it just set
+            if op == CMP and pc + 3 < 256:
+                next_op, reg_c = self.decode(pc + 3)[:2]
+                if next_op in JUMP_CONDITIONS:
+                    comparison = JUMP_CONDITIONS[next_op][2]
+                    lines.append(TRANSLATIONS[CMP].format(a=operand_a, b=operand_b))
+                    lines.append(f"if x {comparison} y: return reg[{reg_c}]")
+                    lines.append(f"return {pc + 5}")
+                    end = pc + 5
+                    break
+
+            if op in TRANSLATIONS:
+                code = TRANSLATIONS[op].format(a=operand_a, b=operand_b, n=pc + advance)
+                lines.extend(code.split("\n"))
+                pc += advance
+                end = pc
+                # stop after touching IM/IS so a new interrupt is noticed
+                if operand_a == 5 or operand_a == 6:
+                    break
+                continue
+
+            if op == JMP:
+                lines.append(f"return reg[{operand_a}]")
+            elif op in JUMP_CONDITIONS:
+                mask, invert = JUMP_CONDITIONS[op][:2]
+                condition = "not " if invert else ""
+                lines.append(f"if {condition}cpu.fl & {mask}: return reg[{operand_a}]")
+                lines.append(f"return {pc + 2}")
+            elif handler is not None:
+                # everything else runs through its handler
+                lines.append(f"cpu.pc = {pc}")
+                lines.append(f"handlers[{op}](cpu, {operand_a}, {operand_b})")
+                if advance == 0:
+                    lines.append("return cpu.pc")
+                else:
+                    lines.append(f"return {pc + advance}")
+            else:
+                # invalid command
+                break
+            end = pc + (op >> 6) + 1
+            break
+
+        if not lines:
+            return None
+        if not lines[-1].startswith("return"):
+            lines.append(f"return {pc}")
+
+        # remember which addresses the block was translated from, so writes
+        # to them drop it
+        for address in range(start, end):
+            self.translated[address & 0xFF] = 1
+
+        source = "def block(cpu=cpu, ram=ram, reg=reg, handlers=handlers, translated=translated):\n"
+        source += "".join(f"    {line}\n" for line in lines)
+        namespace = {
+            "cpu": self,
+            "ram": self.ram,
+            "reg": self.reg,
+            "handlers": self.branchtable,
+            "translated": self.translated,
+        }
+        exec(compile(source, f"<ls8 block {start:02X}>", "exec"), namespace)
+        return namespace["block"]
+
+    def invalidate(self):
+        """
+        Drop every translated block. Called when ram is written at an address
+        a block was translated from (e.g. the stack growing into the program),
+        so the code is translated again from its new contents.
+        """
+        self.blocks[:] = [None] * 256
+        self.translated[:] = bytes(256)
 
     def alu(self, op, reg_a, reg_b):
-        """ALU operations."""
-
-        if op == ADD:
-            self.reg[reg_a] += self.reg[reg_b]
-        elif op == SUB:
-            self.reg[reg_a] -= self.reg[reg_b]
-        elif op == MUL:
-            self.reg[reg_a] *= self.reg[reg_b]
-        elif op == DIV:
-            if self.reg[reg_b] == 0:
-                print("ERROR: cannot divide by zero")
-                sys.exit(1)
-            self.reg[reg_a] /= self.reg[reg_b]
-        elif op == AND:
-            self.reg[reg_a] = self.reg[reg_a] & self.reg[reg_b]
-        elif op == CMP:
-            if self.reg[reg_a] == self.reg[reg_b]:
-                self.fl = 0b00000001
-
-            elif self.reg[reg_a] > self.reg[reg_b]:
-                self.fl = 0b00000010
-
-            elif self.reg[reg_a] < self.reg[reg_b]:
-                self.fl = 0b00000100
-        elif op == DEC:
-            self.reg[reg_a] -= 1
-        elif op == INC:
-            self.reg[reg_a] += 1
-        elif op == MOD:
-            if self.reg[reg_b] == 0:
-                print("ERROR: cannot divide by zero")
-                sys.exit(1)
-            self.reg[reg_a] %= self.reg[reg_b]
-        elif op == NOT:
-            self.reg[reg_a] = ~self.reg[reg_a]
-        elif op == OR:
-            self.reg[reg_a] = self.reg[reg_a] | self.reg[reg_b]
-        elif op == SHL:
-            self.reg[reg_a] = self.reg[reg_a] << self.reg[reg_b]
-        elif op == SHR:
-            self.reg[reg_a] = self.reg[reg_a] >> self.reg[reg_b]
-        elif op == XOR:
-            self.reg[reg_a] = self.reg[reg_a] ^ self.reg[reg_b]
-        elif op == ADDI:
-            val = reg_b
-            self.reg[reg_a] += val
-        else:
+        """
+        ALU operations. Unused by the emulator itself (run() executes ALU
+        commands through translated blocks and the branch table); kept as
+        public API for running a single ALU op by opcode.
+        """
+        handler = self.alutable[op]
+        if handler is None:
             raise Exception("Unsupported ALU operation")
+        handler(self, reg_a, reg_b)
 
-        # keep value between 0-255
-        self.reg[reg_a] = self.reg[reg_a] & 0xFF
+    # ALU handlers - each keeps the result between 0-255
+
+    def ADD(self, reg_a, reg_b):
+        self.reg[reg_a] = (self.reg[reg_a] + self.reg[reg_b]) & 0xFF
+
+    def SUB(self, reg_a, reg_b):
+        self.reg[reg_a] = (self.reg[reg_a] - self.reg[reg_b]) & 0xFF
+
+    def MUL(self, reg_a, reg_b):
+        self.reg[reg_a] = (self.reg[reg_a] * self.reg[reg_b]) & 0xFF
+
+    def DIV(self, reg_a, reg_b):
+        if self.reg[reg_b] == 0:
+            raise GuestDivZero
+        self.reg[reg_a] = self.reg[reg_a] // self.reg[reg_b]
+
+    def AND(self, reg_a, reg_b):
+        self.reg[reg_a] = self.reg[reg_a] & self.reg[reg_b]
+
+    def CMP(self, reg_a, reg_b):
+        if self.reg[reg_a] == self.reg[reg_b]:
+            self.fl = 0b00000001
+
+        elif self.reg[reg_a] > self.reg[reg_b]:
+            self.fl = 0b00000010
+
+        elif self.reg[reg_a] < self.reg[reg_b]:
+            self.fl = 0b00000100
+
+    def DEC(self, reg_a, reg_b):
+        self.reg[reg_a] = (self.reg[reg_a] - 1) & 0xFF
+
+    def INC(self, reg_a, reg_b):
+        self.reg[reg_a] = (self.reg[reg_a] + 1) & 0xFF
+
+    def MOD(self, reg_a, reg_b):
+        if self.reg[reg_b] == 0:
+            raise GuestDivZero
+        self.reg[reg_a] = self.reg[reg_a] % self.reg[reg_b]
+
+    def NOT(self, reg_a, reg_b):
+        self.reg[reg_a] = ~self.reg[reg_a] & 0xFF
+
+    def OR(self, reg_a, reg_b):
+        self.reg[reg_a] = self.reg[reg_a] | self.reg[reg_b]
+
+    def SHL(self, reg_a, reg_b):
+        self.reg[reg_a] = (self.reg[reg_a] << self.reg[reg_b]) & 0xFF
+
+    def SHR(self, reg_a, reg_b):
+        self.reg[reg_a] = self.reg[reg_a] >> self.reg[reg_b]
+
+    def XOR(self, reg_a, reg_b):
+        self.reg[reg_a] = self.reg[reg_a] ^ self.reg[reg_b]
+
+    def ADDI(self, reg_a, val):
+        self.reg[reg_a] = (self.reg[reg_a] + val) & 0xFF
 
     def trace(self):
         """
-        Handy function to print out the CPU state. You might want to call this
-        from run() if you need help debugging.
+        Handy function to print out the CPU state. Debugging only - it is not
+        called from run(); if you call it from there, set self.pc = pc first,
+        since run() keeps the pc in a local.
         """
 
-        print(f"TRACE: %02X | %02X %02X %02X |" % (
+        print("TRACE: %02X | %02X %02X %02X | %s" % (
             self.pc,
             # self.fl,
             # self.ie,
             self.ram_read(self.pc),
             self.ram_read(self.pc + 1),
-            self.ram_read(self.pc + 2)
-        ), end='')
-
-        for i in range(8):
-            print(" %02X" % self.reg[i], end='')
-
-        print()
+            self.ram_read(self.pc + 2),
+            " ".join("%02X" % r for r in self.reg),
+        ))
 
     def run(self):
         """Run the CPU."""
-        start_time = time.time()
-        offset = 1
+        # bind hot state to locals; pc is written back to self.pc only
+        # around code that reads or changes it (handlers and interrupts)
+        ram = self.ram
+        reg = self.reg
+        blocks = self.blocks
+        pc = self.pc
+        # only interrupts and handlers (IRET) change this, so it is re-read
+        # after each of them
+        interrupts_enabled = self.interrupts_enabled
+
+        # the timer and interrupt checks are skipped until the program uses
+        # IM/IS or INT/IRET, since interrupts cannot fire before then
+        uses_interrupts = self.uses_interrupts
+
+        # timer interrupt fires once a second
+        clock = time.time
+        next_timer = clock() + 1
 
         while True:
-            current_time = time.time()
-            if current_time - start_time >= offset:
-                self.reg[6] = self.reg[6] ^ 0b00000001
-                offset += 1
-
-            # check for interrupts if enabled
-            if self.interrupts_enabled:
-                # The IM register is bitwise AND-ed with the IS register and the results stored as maskedInterrupts.
-                masked_interrupts = self.reg[5] & self.reg[6]
-                # Each bit of maskedInterrupts is checked, starting from 0 and going up to the 7th bit, one for each interrupt.
-                for bit in range(8):
-                    # If a bit is found to be set, follow the next sequence of steps.
-                    if masked_interrupts & (0b00000001 << bit) != 0:
+            if uses_interrupts:
+                now = clock()
+                if now >= next_timer:
+                    # toggle once per elapsed second, including any that
+                    # passed while the checks were skipped
+                    seconds = int(now - next_timer) + 1
+                    reg[6] = reg[6] ^ (seconds & 0b00000001)
+                    next_timer += seconds
+
+                # check for interrupts if enabled
+                if interrupts_enabled:
+                    # The IM register is bitwise AND-ed with the IS register and the results stored as maskedInterrupts.
+                    masked_interrupts = reg[5] & reg[6]
+                    # If any bit is set, service the lowest one (bit 0 has the highest priority).
+                    if masked_interrupts:
+                        bit = (masked_interrupts & -masked_interrupts).bit_length() - 1
+                        self.pc = pc
                         self.interrupt(bit)
-                        # Stop further checking of maskedInterrupts.
-                        break
-
-            # instruction register
-            ir = self.pc
-
-            # read command
-            op = self.ram_read(ir)
-            # read operands
-            operand_a = self.ram_read(ir + 1)
-            operand_b = self.ram_read(ir + 2)
-
-            # execute command
-            if op in self.branchtable:
-                # check if alu operation
-                if op & 0b00100000 != 0:
-                    self.branchtable[op](op, operand_a, operand_b)
-                # check number of operands
-                elif op >> 6 == 0:
-                    self.branchtable[op]()
-                elif op >> 6 == 1:
-                    self.branchtable[op](operand_a)
-                elif op >> 6 == 2:
-                    self.branchtable[op](operand_a, operand_b)
-            else:
-                print(f"Command not found: {bin(op)}")
-                sys.exit(1)
-
-            # check if command sets pc
-            # if not, update pc
-            if op & 0b00010000 == 0:
-                # op: AABCDDDD, where AA == num operands
-                self.pc += (op >> 6) + 1
+                        pc = self.pc
+                        interrupts_enabled = self.interrupts_enabled
+
+            # run the translated block at pc, translating it on first use
+            block = blocks[pc]
+            if block is None:
+                block = blocks[pc] = self.translate(pc)
+                uses_interrupts = self.uses_interrupts
+                # only an invalid command at pc leaves nothing to translate
+                if block is None:
+                    print(f"Command not found: {bin(ram[pc])}")
+                    sys.exit(1)
+            pc = block()
+            interrupts_enabled = self.interrupts_enabled
 
     def ram_read(self, mar):  # mar - Memory Address Register
         """Return value stored at address"""
@@ -269,7 +480,10 @@ class CPU:
 
     def ram_write(self, mar, mdr):
         """Write value to address"""
-        self.ram[mar] = mdr
+        self.ram[mar] = mdr & 0xFF
+        # drop translated code that was just overwritten
+        if self.translated[mar]:
+            self.invalidate()
 
     def HLT(self):
         sys.exit(0)
@@ -284,21 +498,21 @@ class CPU:
 
     def PUSH(self, reg_a):
         # decrement sp
-        self.reg[7] -= 1
+        self.reg[7] = (self.reg[7] - 1) & 0xFF
         # copy value in the given register to the address pointed to by sp
-        self.ram[self.reg[7]] = self.reg[reg_a]
+        self.ram_write(self.reg[7], self.reg[reg_a])
 
     def POP(self, reg_a):
         # copy the value from the address pointed to by sp to the given register
         self.reg[reg_a] = self.ram[self.reg[7]]
         # increment sp
-        self.reg[7] += 1
+        self.reg[7] = (self.reg[7] + 1) & 0xFF
 
     def CALL(self, reg_a):
         # push return address on to stack
-        ret_addr = self.pc + 2
-        self.reg[7] -= 1
-        self.ram[self.reg[7]] = ret_addr
+        ret_addr = (self.pc + 2) & 0xFF
+        self.reg[7] = (self.reg[7] - 1) & 0xFF
+        self.ram_write(self.reg[7], ret_addr)
 
         # set pc to address stored in given register
         self.pc = self.reg[reg_a]
@@ -306,57 +520,11 @@ class CPU:
     def RET(self):
         # pop the value from top of the stack and store it in the pc
         self.pc = self.ram[self.reg[7]]
-        self.reg[7] += 1
+        self.reg[7] = (self.reg[7] + 1) & 0xFF
 
     def ST(self, reg_a, reg_b):
         # store value in register b in the address stored in register a
-        self.ram[self.reg[reg_a]] = self.reg[reg_b]
-
-    def JMP(self, reg_a):
-        # set the pc to the address stored in the given register
-        self.pc = self.reg[reg_a]
-
-    def JEQ(self, reg_a):
-        # if equal flag set to true, jump to address stored in given register
-        if self.fl & 0b00000001 != 0:
-            self.JMP(reg_a)
-        else:
-            self.pc += 2
-
-    def JGE(self, reg_a):
-        # if greater-than flag or equal flag set to true, jump to address stored in given register
-        if self.fl & 0b00000011 != 0:
-            self.JMP(reg_a)
-        else:
-            self.pc += 2
-
-    def JGT(self, reg_a):
-        # if greater-than flag set to true, jump to address stored in given register
-        if self.fl & 0b00000010 != 0:
-            self.JMP(reg_a)
-        else:
-            self.pc += 2
-
-    def JLE(self, reg_a):
-        # if less-than flag or equal flag set to true, jump to address stored in given register
-        if self.fl & 0b00000101 != 0:
-            self.JMP(reg_a)
-        else:
-            self.pc += 2
-
-    def JLT(self, reg_a):
-        # if less-than flag set to true, jump to address stored in given register
-        if self.fl & 0b00000100 != 0:
-            self.JMP(reg_a)
-        else:
-            self.pc += 2
-
-    def JNE(self, reg_a):
-        # if equal flag is clear (false, 0), jump to the address stored in the given register.
-        if self.fl & 0b00000001 == 0:
-            self.JMP(reg_a)
-        else:
-            self.pc += 2
+        self.ram_write(self.reg[reg_a], self.reg[reg_b])
 
     def LD(self, reg_a, reg_b):
         # loads register a with the value at the memory address stored in register b
@@ -374,7 +542,7 @@ class CPU:
     def INT(self, reg_a):
         # Issue the interrupt number stored in the given register.
         # This will set the _n_th bit in the IS register to the value in the given register.
-        self.reg[6] = 0b00000001 << self.reg[reg_a]
+        self.reg[6] = (0b00000001 << self.reg[reg_a]) & 0xFF
 
     def IRET(self):
         # Return from an interrupt handler.
@@ -389,10 +557,10 @@ class CPU:
         self.POP(0)
         # The FL register is popped off the stack.
         self.fl = self.ram[self.reg[7]]
-        self.reg[7] += 1
+        self.reg[7] = (self.reg[7] + 1) & 0xFF
         # The return address is popped off the stack and stored in PC.
         self.pc = self.ram[self.reg[7]]
-        self.reg[7] += 1
+        self.reg[7] = (self.reg[7] + 1) & 0xFF
         # Interrupts are re-enabled
         self.interrupts_enabled = 1
 
@@ -402,11 +570,11 @@ class CPU:
         # Clear the bit in the IS register.
         self.reg[6] = self.reg[6] ^ (0b00000001 << bit)
         # The PC register is pushed on the stack.
-        self.reg[7] -= 1
-        self.ram[self.reg[7]] = self.pc
+        self.reg[7] = (self.reg[7] - 1) & 0xFF
+        self.ram_write(self.reg[7], self.pc)
         # The FL register is pushed on the stack.
-        self.reg[7] -= 1
-        self.ram[self.reg[7]] = self.fl
+        self.reg[7] = (self.reg[7] - 1) & 0xFF
+        self.ram_write(self.reg[7], self.fl)
         # Registers R0-R6 are pushed on the stack in that order.
         self.PUSH(0)
         self.PUSH(1)
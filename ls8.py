@@ -8,4 +8,9 @@ from cpu import *
 cpu = CPU()
 
 cpu.load()
-cpu.run()
\ No newline at end of file
+
+try:
+    cpu.run()
+except GuestDivZero:
+    print("ERROR: cannot divide by zero")
+    sys.exit(1)
\ No newline at end of file